@@ -204,7 +204,7 @@ def main():
             target_acos=args.acos,
             min_bid=args.min_bid,
             max_bid=args.max_bid,
-            status=args.status
+            status=sys.intern(args.status)
         )
 
         if args.amazon_export:
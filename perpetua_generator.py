@@ -7,12 +7,15 @@ Custom (Single-Campaign) Goals with proper naming convention.
 Naming Convention: SKU - ASIN [SP_SEGMENT_MATCHTYPE] JN
 """
 
-import pandas as pd
+import csv
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 from dataclasses import dataclass
-from keyword_extractor import CampaignKeywords
-from progress import ProgressBar, Spinner
+from progress import ProgressBar
+
+if TYPE_CHECKING:
+    # keyword_extractor imports pandas; only needed for annotations here
+    from keyword_extractor import CampaignKeywords
 
 
 def load_negative_asins(file_path: str) -> List[str]:
@@ -35,12 +38,9 @@ def load_negative_asins(file_path: str) -> List[str]:
     if not content:
         return []
 
-    # Split by comma or newline, filter empty strings
-    asins = []
-    for item in content.replace('\n', ',').split(','):
-        asin = item.strip()
-        if asin and len(asin) == 10:  # Valid ASIN length
-            asins.append(asin)
+    # Split by comma or newline, keep valid-length ASINs (drops empty strings)
+    items = map(str.strip, content.replace('\n', ',').split(','))
+    asins = [asin for asin in items if len(asin) == 10]
 
     return list(dict.fromkeys(asins))  # Deduplicate while preserving order
 
@@ -121,6 +121,38 @@ COLUMNS = {
     'W': 'Product SKU',           # For Product rows
 }
 
+# Header row / column order, computed once
+_COLUMN_ORDER = tuple(COLUMNS.values())
+
+# Column positions - rows are plain lists in COLUMNS order
+COL_IDX = {name: i for i, name in enumerate(_COLUMN_ORDER)}
+N_COLS = len(COL_IDX)
+
+_RECORD_TYPE = COL_IDX['Record Type']
+_GOAL_NAME = COL_IDX['Goal Name']
+_STATUS = COL_IDX['Status']
+_DAILY_BUDGET = COL_IDX['Daily Budget']
+_TARGET_ACOS = COL_IDX['Target ACoS']
+_EXACT_KW = COL_IDX['Exact Keywords']
+_PHRASE_KW = COL_IDX['Phrase Keywords']
+_BROAD_KW = COL_IDX['Broad Keywords']
+_PAT_TARGETS = COL_IDX['PAT Targets']
+_NEGATIVE_EXACT = COL_IDX['Negative Exact']
+_NEGATIVE_PHRASE = COL_IDX['Negative Phrase']
+_MIN_BID = COL_IDX['Min Bid']
+_MAX_BID = COL_IDX['Max Bid']
+_PRODUCT_ASIN = COL_IDX['Product ASIN']
+_PRODUCT_SKU = COL_IDX['Product SKU']
+
+# Blank row template, copied for every goal/product row
+_EMPTY_ROW = [''] * N_COLS
+
+# Output file buffer size - rows are streamed straight to disk
+CSV_WRITE_BUFFER = 1024 * 1024
+
+# Rows collected before each csv.writer.writerows call
+CSV_WRITE_BATCH = 2048
+
 
 def generate_goal_name(sku: str, asin: str, campaign_type: str) -> str:
     """
@@ -140,10 +172,15 @@ def generate_goal_name(sku: str, asin: str, campaign_type: str) -> str:
     Returns:
         Formatted goal name (max 60 chars)
     """
-    name = f"{sku} - JN - {asin} [SP_{campaign_type}]"
+    name = _goal_name_prefix(sku, asin) + campaign_type + "]"
     return name[:60]  # Truncate to max 60 chars
 
 
+def _goal_name_prefix(sku: str, asin: str) -> str:
+    """Shared part of every goal name for a SKU, up to the campaign type."""
+    return f"{sku} - JN - {asin} [SP_"
+
+
 # Campaign type definitions for 12-campaign structure (competitor split by match type)
 CAMPAIGN_TYPES = [
     # (campaign_type_id, record_type, description)
@@ -161,10 +198,30 @@ CAMPAIGN_TYPES = [
     ('AUTO', 'SingleCampaign_KW', 'Automatic'),
 ]
 
+# Keyword source for each campaign type, in CAMPAIGN_TYPES order
+CAMPAIGN_SPEC = [
+    # (CampaignKeywords attribute, campaign_type_id, keyword column, negatives key)
+    ('branded_exact', 'BRANDED_EXACT', _EXACT_KW, 'branded_exact'),
+    ('branded_phrase', 'BRANDED_PHRASE', _PHRASE_KW, 'branded_phrase'),
+    ('branded_broad', 'BRANDED_BROAD', _BROAD_KW, 'branded_broad'),
+    ('branded_pat_targets', 'BRANDED_PAT', _PAT_TARGETS, 'branded_pat'),
+    ('unbranded_exact', 'MANUAL_EXACT', _EXACT_KW, 'unbranded_exact'),
+    ('unbranded_phrase', 'MANUAL_PHRASE', _PHRASE_KW, 'unbranded_phrase'),
+    ('unbranded_broad', 'MANUAL_BROAD', _BROAD_KW, 'unbranded_broad'),
+    ('competitor_exact', 'COMPETITOR_EXACT', _EXACT_KW, 'competitor_exact'),
+    ('competitor_phrase', 'COMPETITOR_PHRASE', _PHRASE_KW, 'competitor_phrase'),
+    ('competitor_broad', 'COMPETITOR_BROAD', _BROAD_KW, 'competitor_broad'),
+    ('competitor_pat_targets', 'COMPETITOR_PAT', _PAT_TARGETS, 'competitor_pat'),
+    ('auto_keywords', 'AUTO', _EXACT_KW, 'auto'),
+]
+
 
 # Minimum budget failsafe
 MIN_BUDGET = 5
 
+# Goal name tail per campaign type, appended to _goal_name_prefix()
+_NAME_SUFFIX = {ctype: ctype + "]" for ctype, _, _ in CAMPAIGN_TYPES}
+
 
 def create_goal_row(
     goal_type: str,
@@ -178,9 +235,9 @@ def create_goal_row(
     negative_exact: Optional[List[str]] = None,
     negative_phrase: Optional[List[str]] = None,
     negative_asins: Optional[List[str]] = None,
-) -> Dict:
+) -> List:
     """Create a goal row for Perpetua CSV with segment-specific budget and ACOS."""
-    row = {col: '' for col in COLUMNS.values()}
+    row = _EMPTY_ROW.copy()
 
     # Get segment-specific budget and ACOS
     budget = BUDGET_ALLOCATION.get(campaign_type, config.daily_budget)
@@ -190,49 +247,72 @@ def create_goal_row(
     if budget < MIN_BUDGET:
         budget = MIN_BUDGET
 
-    row['Record Type'] = goal_type
-    row['Goal Name'] = goal_name
-    row['Status'] = config.status
-    row['Daily Budget'] = budget
-    row['Target ACoS'] = acos
-    row['Min Bid'] = config.min_bid
-    row['Max Bid'] = config.max_bid
+    row[_RECORD_TYPE] = goal_type
+    row[_GOAL_NAME] = goal_name
+    row[_STATUS] = config.status
+    row[_DAILY_BUDGET] = budget
+    row[_TARGET_ACOS] = acos
+    row[_MIN_BID] = config.min_bid
+    row[_MAX_BID] = config.max_bid
 
     if exact_kw:
-        row['Exact Keywords'] = ','.join(exact_kw)
+        row[_EXACT_KW] = ','.join(exact_kw)
     if phrase_kw:
-        row['Phrase Keywords'] = ','.join(phrase_kw)
+        row[_PHRASE_KW] = ','.join(phrase_kw)
     if broad_kw:
-        row['Broad Keywords'] = ','.join(broad_kw)
+        row[_BROAD_KW] = ','.join(broad_kw)
     if pat_targets:
-        row['PAT Targets'] = ','.join(pat_targets)
+        row[_PAT_TARGETS] = ','.join(pat_targets)
     if negative_exact:
-        row['Negative Exact'] = ','.join(negative_exact)
+        row[_NEGATIVE_EXACT] = ','.join(negative_exact)
     if negative_phrase:
-        row['Negative Phrase'] = ','.join(negative_phrase)
+        row[_NEGATIVE_PHRASE] = ','.join(negative_phrase)
     # For PAT campaigns, negative ASINs go in the Negative Exact column
     if negative_asins:
-        existing = row['Negative Exact']
+        existing = row[_NEGATIVE_EXACT]
         if existing:
-            row['Negative Exact'] = existing + ',' + ','.join(negative_asins)
+            row[_NEGATIVE_EXACT] = ','.join([existing, *negative_asins])
         else:
-            row['Negative Exact'] = ','.join(negative_asins)
+            row[_NEGATIVE_EXACT] = ','.join(negative_asins)
 
     return row
 
 
-def create_product_row(asin: str, sku: str, status: str = "Enabled") -> Dict:
+def create_product_row(asin: str, sku: str, status: str = "Enabled") -> List:
     """Create a product row for Perpetua CSV."""
-    row = {col: '' for col in COLUMNS.values()}
-    row['Record Type'] = 'Product'
-    row['Status'] = status
-    row['Product ASIN'] = asin
-    row['Product SKU'] = sku
+    row = _EMPTY_ROW.copy()
+    row[_RECORD_TYPE] = 'Product'
+    row[_STATUS] = status
+    row[_PRODUCT_ASIN] = asin
+    # A blank SKU cell loads as NaN (the only value not equal to itself);
+    # write it as an empty cell like pandas' to_csv did
+    row[_PRODUCT_SKU] = '' if sku is None or sku != sku else sku
     return row
 
 
+def _goal_row_templates(config: GoalConfig) -> Dict[str, List]:
+    """
+    Build one unnamed goal row per CAMPAIGN_TYPES entry, keyed by campaign type id.
+
+    Numeric cells are converted to strings here, once per run, instead of
+    by the CSV writer on every row.
+    """
+    templates = {}
+    for campaign_type_id, record_type, _ in CAMPAIGN_TYPES:
+        row = create_goal_row(
+            goal_type=record_type,
+            goal_name='',
+            config=config,
+            campaign_type=campaign_type_id
+        )
+        for col in (_DAILY_BUDGET, _TARGET_ACOS, _MIN_BID, _MAX_BID):
+            row[col] = str(row[col])
+        templates[campaign_type_id] = row
+    return templates
+
+
 def generate_perpetua_csv(
-    campaign_keywords: Dict[str, CampaignKeywords],
+    campaign_keywords: Dict[str, 'CampaignKeywords'],
     config: GoalConfig,
     output_path: str,
     global_negative_asins: Optional[List[str]] = None
@@ -263,222 +343,76 @@ def generate_perpetua_csv(
     Returns:
         Path to generated CSV file
     """
-    rows = []
+    row_count = 0
     total_skus = len(campaign_keywords)
     progress = ProgressBar(total=total_skus, description="Generating goals")
+    # Redraw the bar ~200 times at most, not once per SKU
+    update_every = max(1, total_skus // 200)
+    pending = 0
 
     # Log global negatives if provided
     if global_negative_asins:
         print(f"  Applying {len(global_negative_asins)} global negative ASINs to PAT campaigns")
-
-    for asin, kw_data in campaign_keywords.items():
-        sku = kw_data.sku
-
-        # 1. Branded - Exact
-        if kw_data.branded_exact:
-            negs = kw_data.get_negatives('branded_exact')
-            goal_name = generate_goal_name(sku, asin, 'BRANDED_EXACT')
-            goal_row = create_goal_row(
-                goal_type='SingleCampaign_KW',
-                goal_name=goal_name,
-                config=config,
-                campaign_type='BRANDED_EXACT',
-                exact_kw=kw_data.branded_exact,
-                negative_exact=negs['exact'] if negs['exact'] else None,
-                negative_phrase=negs['phrase'] if negs['phrase'] else None
-            )
-            rows.append(goal_row)
-            rows.append(create_product_row(asin, sku))
-
-        # 2. Branded - Phrase
-        if kw_data.branded_phrase:
-            negs = kw_data.get_negatives('branded_phrase')
-            goal_name = generate_goal_name(sku, asin, 'BRANDED_PHRASE')
-            goal_row = create_goal_row(
-                goal_type='SingleCampaign_KW',
-                goal_name=goal_name,
-                config=config,
-                campaign_type='BRANDED_PHRASE',
-                phrase_kw=kw_data.branded_phrase,
-                negative_exact=negs['exact'] if negs['exact'] else None,
-                negative_phrase=negs['phrase'] if negs['phrase'] else None
-            )
-            rows.append(goal_row)
-            rows.append(create_product_row(asin, sku))
-
-        # 3. Branded - Broad
-        if kw_data.branded_broad:
-            negs = kw_data.get_negatives('branded_broad')
-            goal_name = generate_goal_name(sku, asin, 'BRANDED_BROAD')
-            goal_row = create_goal_row(
-                goal_type='SingleCampaign_KW',
-                goal_name=goal_name,
-                config=config,
-                campaign_type='BRANDED_BROAD',
-                broad_kw=kw_data.branded_broad,
-                negative_exact=negs['exact'] if negs['exact'] else None,
-                negative_phrase=negs['phrase'] if negs['phrase'] else None
-            )
-            rows.append(goal_row)
-            rows.append(create_product_row(asin, sku))
-
-        # 4. Branded - PAT (uses negative ASINs stored in campaign_negatives + global negatives)
-        if kw_data.branded_pat_targets:
-            negs = kw_data.get_negatives('branded_pat')
-            goal_name = generate_goal_name(sku, asin, 'BRANDED_PAT')
-            goal_row = create_goal_row(
-                goal_type='SingleCampaign_PAT',
-                goal_name=goal_name,
-                config=config,
-                campaign_type='BRANDED_PAT',
-                pat_targets=kw_data.branded_pat_targets,
-                negative_asins=global_negative_asins
-            )
-            rows.append(goal_row)
-            rows.append(create_product_row(asin, sku))
-
-        # 5. Unbranded - Exact
-        if kw_data.unbranded_exact:
-            negs = kw_data.get_negatives('unbranded_exact')
-            goal_name = generate_goal_name(sku, asin, 'MANUAL_EXACT')
-            goal_row = create_goal_row(
-                goal_type='SingleCampaign_KW',
-                goal_name=goal_name,
-                config=config,
-                campaign_type='MANUAL_EXACT',
-                exact_kw=kw_data.unbranded_exact,
-                negative_exact=negs['exact'] if negs['exact'] else None,
-                negative_phrase=negs['phrase'] if negs['phrase'] else None
-            )
-            rows.append(goal_row)
-            rows.append(create_product_row(asin, sku))
-
-        # 6. Unbranded - Phrase
-        if kw_data.unbranded_phrase:
-            negs = kw_data.get_negatives('unbranded_phrase')
-            goal_name = generate_goal_name(sku, asin, 'MANUAL_PHRASE')
-            goal_row = create_goal_row(
-                goal_type='SingleCampaign_KW',
-                goal_name=goal_name,
-                config=config,
-                campaign_type='MANUAL_PHRASE',
-                phrase_kw=kw_data.unbranded_phrase,
-                negative_exact=negs['exact'] if negs['exact'] else None,
-                negative_phrase=negs['phrase'] if negs['phrase'] else None
-            )
-            rows.append(goal_row)
-            rows.append(create_product_row(asin, sku))
-
-        # 7. Unbranded - Broad
-        if kw_data.unbranded_broad:
-            negs = kw_data.get_negatives('unbranded_broad')
-            goal_name = generate_goal_name(sku, asin, 'MANUAL_BROAD')
-            goal_row = create_goal_row(
-                goal_type='SingleCampaign_KW',
-                goal_name=goal_name,
-                config=config,
-                campaign_type='MANUAL_BROAD',
-                broad_kw=kw_data.unbranded_broad,
-                negative_exact=negs['exact'] if negs['exact'] else None,
-                negative_phrase=negs['phrase'] if negs['phrase'] else None
-            )
-            rows.append(goal_row)
-            rows.append(create_product_row(asin, sku))
-
-        # 8. Competitor - Exact
-        if kw_data.competitor_exact:
-            negs = kw_data.get_negatives('competitor_exact')
-            goal_name = generate_goal_name(sku, asin, 'COMPETITOR_EXACT')
-            goal_row = create_goal_row(
-                goal_type='SingleCampaign_KW',
-                goal_name=goal_name,
-                config=config,
-                campaign_type='COMPETITOR_EXACT',
-                exact_kw=kw_data.competitor_exact,
-                negative_exact=negs['exact'] if negs['exact'] else None,
-                negative_phrase=negs['phrase'] if negs['phrase'] else None
-            )
-            rows.append(goal_row)
-            rows.append(create_product_row(asin, sku))
-
-        # 9. Competitor - Phrase
-        if kw_data.competitor_phrase:
-            negs = kw_data.get_negatives('competitor_phrase')
-            goal_name = generate_goal_name(sku, asin, 'COMPETITOR_PHRASE')
-            goal_row = create_goal_row(
-                goal_type='SingleCampaign_KW',
-                goal_name=goal_name,
-                config=config,
-                campaign_type='COMPETITOR_PHRASE',
-                phrase_kw=kw_data.competitor_phrase,
-                negative_exact=negs['exact'] if negs['exact'] else None,
-                negative_phrase=negs['phrase'] if negs['phrase'] else None
-            )
-            rows.append(goal_row)
-            rows.append(create_product_row(asin, sku))
-
-        # 10. Competitor - Broad
-        if kw_data.competitor_broad:
-            negs = kw_data.get_negatives('competitor_broad')
-            goal_name = generate_goal_name(sku, asin, 'COMPETITOR_BROAD')
-            goal_row = create_goal_row(
-                goal_type='SingleCampaign_KW',
-                goal_name=goal_name,
-                config=config,
-                campaign_type='COMPETITOR_BROAD',
-                broad_kw=kw_data.competitor_broad,
-                negative_exact=negs['exact'] if negs['exact'] else None,
-                negative_phrase=negs['phrase'] if negs['phrase'] else None
-            )
-            rows.append(goal_row)
-            rows.append(create_product_row(asin, sku))
-
-        # 11. Competitor - PAT (uses negative ASINs stored in campaign_negatives + global negatives)
-        if kw_data.competitor_pat_targets:
-            negs = kw_data.get_negatives('competitor_pat')
-            goal_name = generate_goal_name(sku, asin, 'COMPETITOR_PAT')
-            goal_row = create_goal_row(
-                goal_type='SingleCampaign_PAT',
-                goal_name=goal_name,
-                config=config,
-                campaign_type='COMPETITOR_PAT',
-                pat_targets=kw_data.competitor_pat_targets,
-                negative_asins=global_negative_asins
-            )
-            rows.append(goal_row)
-            rows.append(create_product_row(asin, sku))
-
-        # 12. Automatic
-        if kw_data.auto_keywords:
-            negs = kw_data.get_negatives('auto')
-            goal_name = generate_goal_name(sku, asin, 'AUTO')
-            goal_row = create_goal_row(
-                goal_type='SingleCampaign_KW',
-                goal_name=goal_name,
-                config=config,
-                campaign_type='AUTO',
-                exact_kw=kw_data.auto_keywords,
-                negative_exact=negs['exact'] if negs['exact'] else None,
-                negative_phrase=negs['phrase'] if negs['phrase'] else None
-            )
-            rows.append(goal_row)
-            rows.append(create_product_row(asin, sku))
-
-        progress.update(1)
-
+        # Same list for every PAT goal - join it once
+        global_negatives = ','.join(global_negative_asins)
+    else:
+        global_negatives = ''
+
+    # Resolve each campaign's template and name tail by type id, once per run
+    templates = _goal_row_templates(config)
+    campaigns = [
+        (attr, kw_col, neg_key, _NAME_SUFFIX[ctype], templates[ctype])
+        for attr, ctype, kw_col, neg_key in CAMPAIGN_SPEC
+    ]
+
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(_COLUMN_ORDER)
+        batch = []
+
+        for asin, kw_data in campaign_keywords.items():
+            sku = kw_data.sku
+            name_prefix = _goal_name_prefix(sku, asin)
+            # Each goal needs its own Product row; the row is the same for all of them
+            product_row = create_product_row(asin, sku)
+
+            for attr, kw_col, neg_key, name_suffix, template in campaigns:
+                keywords = getattr(kw_data, attr)
+                if not keywords:
+                    continue
+
+                goal_row = template.copy()
+                goal_row[_GOAL_NAME] = (name_prefix + name_suffix)[:60]
+                goal_row[kw_col] = ','.join(keywords)
+                if kw_col == _PAT_TARGETS:
+                    # PAT campaigns use the global negative ASINs
+                    goal_row[_NEGATIVE_EXACT] = global_negatives
+                else:
+                    negs = kw_data.get_negatives(neg_key)
+                    if negs['exact']:
+                        goal_row[_NEGATIVE_EXACT] = ','.join(negs['exact'])
+                    if negs['phrase']:
+                        goal_row[_NEGATIVE_PHRASE] = ','.join(negs['phrase'])
+                batch.append(goal_row)
+                batch.append(product_row)
+                if len(batch) >= CSV_WRITE_BATCH:
+                    writer.writerows(batch)
+                    row_count += len(batch)
+                    batch.clear()
+
+            pending += 1
+            if pending == update_every:
+                progress.update(pending)
+                pending = 0
+
+        writer.writerows(batch)
+        row_count += len(batch)
+
+    if pending:
+        progress.update(pending)
     progress.close()
 
-    # Create DataFrame and save
-    with Spinner("Saving CSV file...", style="dots"):
-        df = pd.DataFrame(rows)
-
-        # Reorder columns to match Perpetua expected format
-        column_order = list(COLUMNS.values())
-        df = df.reindex(columns=column_order)
-
-        df.to_csv(output_path, index=False)
-
-    print(f"✓ Saved {len(rows):,} rows to {output_path}")
+    print(f"✓ Saved {row_count:,} rows to {output_path}")
     return output_path
 
 
@@ -512,34 +446,53 @@ def generate_empty_goals_for_asins(
     Returns:
         Path to generated CSV file
     """
-    rows = []
+    row_count = 0
     total_skus = len(asin_sku_map)
-    progress = ProgressBar(total=total_skus, description="Generating goals")
 
-    for asin, sku in asin_sku_map.items():
-        # Create all 12 campaign types using CAMPAIGN_TYPES constant
-        for campaign_type_id, record_type, _ in CAMPAIGN_TYPES:
-            goal_name = generate_goal_name(sku, asin, campaign_type_id)
-            goal_row = create_goal_row(
-                goal_type=record_type,
-                goal_name=goal_name,
-                config=config,
-                campaign_type=campaign_type_id
-            )
-            rows.append(goal_row)
-            rows.append(create_product_row(asin, sku))
-
-        progress.update(1)
+    # Empty goals are identical across SKUs apart from the name
+    goal_templates = [
+        (_NAME_SUFFIX[ctype], template)
+        for ctype, template in _goal_row_templates(config).items()
+    ]
 
+    progress = ProgressBar(total=total_skus, description="Generating goals")
+    # Redraw the bar ~200 times at most, not once per SKU
+    update_every = max(1, total_skus // 200)
+    pending = 0
+
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(_COLUMN_ORDER)
+        batch = []
+
+        for asin, sku in asin_sku_map.items():
+            name_prefix = _goal_name_prefix(sku, asin)
+            product_row = create_product_row(asin, sku)
+
+            # Create all 12 campaign types; only the goal name differs per SKU
+            for name_suffix, template in goal_templates:
+                goal_row = template.copy()
+                goal_row[_GOAL_NAME] = (name_prefix + name_suffix)[:60]
+                batch.append(goal_row)
+                batch.append(product_row)
+                if len(batch) >= CSV_WRITE_BATCH:
+                    writer.writerows(batch)
+                    row_count += len(batch)
+                    batch.clear()
+
+            pending += 1
+            if pending == update_every:
+                progress.update(pending)
+                pending = 0
+
+        writer.writerows(batch)
+        row_count += len(batch)
+
+    if pending:
+        progress.update(pending)
     progress.close()
 
-    with Spinner("Saving CSV file...", style="dots"):
-        df = pd.DataFrame(rows)
-        column_order = list(COLUMNS.values())
-        df = df.reindex(columns=column_order)
-        df.to_csv(output_path, index=False)
-
-    print(f"✓ Saved {len(rows):,} rows to {output_path}")
+    print(f"✓ Saved {row_count:,} rows to {output_path}")
     return output_path
 
 
@@ -30,6 +30,8 @@ class Spinner:
         self.message = message
         self.running = False
         self.thread = None
+        self._stop_event = threading.Event()
+        self._is_tty = sys.stdout.isatty()
 
         styles = {
             "dots": self.DOTS,
@@ -40,27 +42,39 @@ class Spinner:
             "bouncing": self.BOUNCING,
         }
         self.frames = styles.get(style, self.DOTS)
+        self._nframes = len(self.frames)
 
     def _animate(self):
         idx = 0
-        while self.running:
-            frame = self.frames[idx % len(self.frames)]
+        while not self._stop_event.is_set():
+            frame = self.frames[idx]
             sys.stdout.write(f"\r{frame} {self.message}")
             sys.stdout.flush()
             idx += 1
-            time.sleep(0.1)
+            if idx == self._nframes:
+                idx = 0
+            # Returns as soon as stop() sets the event
+            self._stop_event.wait(0.1)
 
     def start(self):
+        if not self._is_tty:
+            # No animation when piped - just log the message once
+            print(self.message)
+            self.running = False
+            return
         self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._animate)
         self.thread.start()
 
     def stop(self, final_message: Optional[str] = None):
         self.running = False
+        self._stop_event.set()
         if self.thread:
             self.thread.join()
         # Clear line and show final message
-        sys.stdout.write("\r" + " " * (len(self.message) + 10) + "\r")
+        if self._is_tty:
+            sys.stdout.write("\r" + " " * (len(self.message) + 10) + "\r")
         if final_message:
             print(f"✓ {final_message}")
         sys.stdout.flush()
@@ -91,67 +105,157 @@ class ProgressBar:
         total: int,
         description: str = "Progress",
         bar_length: int = 30,
-        show_spinner: bool = True
+        show_spinner: bool = True,
+        min_interval: float = 1 / 30
     ):
         self.total = total
         self.description = description
         self.bar_length = bar_length
         self.show_spinner = show_spinner
+        self.min_interval = min_interval  # Seconds between redraws
         self.current = 0
         self.spinner_idx = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self._last_render = 0.0
+        self._last_state = None  # (filled, percent tenths, second) of last frame
+        self._nspin = len(self.SPINNER)
+        self._elapsed_cache = (-1, "")  # (rounded elapsed seconds, its text)
+        self._is_tty = sys.stdout.isatty()
+        self._last_decile = -1  # Last 10% step logged when not a TTY
+
+        # Static pieces of every frame
+        self._bar_cache = [
+            "█" * i + "░" * (bar_length - i) for i in range(bar_length + 1)
+        ]
+        self._total_fmt = f"{total:,}"
 
     def update(self, amount: int = 1):
-        """Update progress by amount."""
+        """
+        Update progress by amount.
+
+        Redraws at most once per min_interval, and only when the bar, the
+        percentage or the elapsed second would visibly change. When stdout
+        is not a TTY, logs a line each time a new 10% step is reached.
+        """
         self.current += amount
-        self._render()
+        if self.current >= self.total:
+            self._render()
+            return
+
+        if not self._is_tty:
+            # Piped: no time gate, so no 10% step is skipped
+            if 10 * self.current // self.total != self._last_decile:
+                self._render()
+            return
+
+        now = time.monotonic()
+        if now - self._last_render < self.min_interval:
+            return
+
+        filled = self.bar_length * self.current // self.total
+        # Key the per-second redraw on the elapsed value _render displays
+        state = (filled, 1000 * self.current // self.total, round(now - self.start_time))
+        if state != self._last_state:
+            self._last_state = state
+            self._last_render = now
+            self._render()
+
+    def iterate(self, iterable, chunk: int = 1):
+        """
+        Yield items from iterable, advancing the bar as they are consumed.
+
+        Updates are batched every `chunk` items; any remainder is counted
+        when iteration stops, even if the loop breaks early or raises.
+
+        Usage:
+            for row in progress.iterate(rows, chunk=100):
+                process(row)
+        """
+        count = 0
+        try:
+            for item in iterable:
+                # Count the item before handing it out, so one in use when
+                # the loop breaks or raises is still counted
+                count += 1
+                yield item
+                if count >= chunk:
+                    self.update(count)
+                    count = 0
+        finally:
+            if count:
+                self.update(count)
 
     def _render(self):
         """Render the progress bar."""
         # Calculate percentage
         percent = min(100, (self.current / self.total) * 100) if self.total > 0 else 0
 
+        # When piped, log one line per 10% instead of redrawing in place
+        if not self._is_tty:
+            decile = min(10, 10 * self.current // self.total) if self.total > 0 else 0
+            if decile == self._last_decile:
+                return
+            self._last_decile = decile
+
         # Calculate filled portion of bar
-        filled = int(self.bar_length * self.current / self.total) if self.total > 0 else 0
+        filled = min(self.bar_length, int(self.bar_length * self.current / self.total)) if self.total > 0 else 0
 
-        # Create bar with gradient effect
-        bar = "█" * filled + "░" * (self.bar_length - filled)
+        # Look up the prebuilt bar for this fill level
+        bar = self._bar_cache[filled]
 
         # Spinner
         spinner = ""
         if self.show_spinner and self.current < self.total:
-            spinner = self.SPINNER[self.spinner_idx % len(self.SPINNER)] + " "
-            self.spinner_idx += 1
+            idx = self.spinner_idx
+            spinner = self.SPINNER[idx] + " "
+            self.spinner_idx = idx + 1 if idx + 1 < self._nspin else 0
         elif self.current >= self.total:
             spinner = "✓ "
 
-        # Elapsed time
-        elapsed = time.time() - self.start_time
+        # Elapsed time (monotonic, so clock adjustments can't make it negative)
+        elapsed = time.monotonic() - self.start_time
 
         # Estimate remaining time
         if self.current > 0 and self.current < self.total:
-            rate = self.current / elapsed
-            remaining = (self.total - self.current) / rate
-            time_str = f" | {elapsed:.0f}s elapsed, ~{remaining:.0f}s remaining"
+            # The elapsed text only changes once per second; the ETA changes
+            # with every step, so it is recomputed on each frame
+            sec = round(elapsed)
+            if sec != self._elapsed_cache[0]:
+                self._elapsed_cache = (sec, f" | {sec}s elapsed, ~")
+            # Same as remaining / rate, without dividing by a zero elapsed
+            remaining = elapsed * (self.total - self.current) / self.current
+            time_str = f"{self._elapsed_cache[1]}{remaining:.0f}s remaining"
         else:
             time_str = f" | {elapsed:.1f}s"
 
         # Format numbers with commas
         current_fmt = f"{self.current:,}"
-        total_fmt = f"{self.total:,}"
 
-        # Build output line
-        line = f"\r{spinner}{self.description}: |{bar}| {percent:5.1f}% ({current_fmt}/{total_fmt}){time_str}"
-
-        # Pad to clear any previous longer line
-        sys.stdout.write(line + " " * 10)
+        if not self._is_tty:
+            done = "✓ " if self.current >= self.total else ""
+            sys.stdout.write("".join((
+                done, self.description, ": |", bar, "| ",
+                f"{percent:5.1f}", "% (", current_fmt, "/", self._total_fmt, ")",
+                time_str, "\n",
+            )))
+            return
+
+        # Build the whole frame; ESC[K erases whatever a longer previous line left
+        line = "".join((
+            "\r", spinner, self.description, ": |", bar, "| ",
+            f"{percent:5.1f}", "% (", current_fmt, "/", self._total_fmt, ")",
+            time_str, "\x1b[K",
+        ))
+
+        sys.stdout.write(line)
         sys.stdout.flush()
 
     def close(self, message: Optional[str] = None):
         """Complete the progress bar."""
         self.current = self.total
         self._render()
-        print()  # New line
+        if self._is_tty:
+            print()  # New line
         if message:
             print(f"✓ {message}")
 
@@ -180,19 +284,20 @@ class MultiStageProgress:
 
     def _render(self):
         """Render all stages."""
-        print("\n" + "=" * 50)
+        # Build the whole panel and write it in one go
+        lines = ["", "=" * 50]
         for i, stage in enumerate(self.stages):
             if i in self.completed:
                 status = "✓"
-                color = ""
             elif i == self.current_stage:
                 status = "►"
-                color = ""
             else:
                 status = "○"
-                color = ""
-            print(f"  {status} {stage}")
-        print("=" * 50 + "\n")
+            lines.append(f"  {status} {stage}")
+        lines.append("=" * 50)
+        lines.append("\n")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
 
     def start(self, stage_idx: int):
         """Mark a stage as in progress."""
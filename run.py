@@ -16,7 +16,6 @@ Usage:
 """
 
 import sys
-import subprocess
 from pathlib import Path
 
 # Default file names
@@ -26,11 +25,22 @@ TRIMMED_FILE = "trimmed.csv"  # CSV to avoid Excel row limits
 OUTPUT_FILE = "goals.csv"
 
 
-def run_command(cmd):
-    """Run a command and print output."""
-    print(f"\n> {' '.join(cmd)}\n")
-    result = subprocess.run(cmd)
-    return result.returncode == 0
+def run_main(args):
+    """Run main.py in this process with the given arguments."""
+    print(f"\n> python3 main.py {' '.join(args)}\n")
+
+    # Imported here so printing usage doesn't pay for pandas
+    import main
+
+    saved_argv = sys.argv
+    sys.argv = ["main.py"] + args
+    try:
+        main.main()
+        return True
+    except SystemExit as e:
+        return e.code in (0, None)
+    finally:
+        sys.argv = saved_argv
 
 
 def main():
@@ -52,8 +62,8 @@ def main():
             print("Place your Amazon bulk export as 'bulk.xlsx' in this folder.")
             sys.exit(1)
 
-        run_command([
-            "python3", "main.py", "trim",
+        run_main([
+            "trim",
             "--bulk-file", BULK_FILE,
             "--asin-sku", ASIN_FILE,
             "--output", TRIMMED_FILE
@@ -64,8 +74,8 @@ def main():
         export_file = TRIMMED_FILE if Path(TRIMMED_FILE).exists() else BULK_FILE
 
         if Path(export_file).exists():
-            run_command([
-                "python3", "main.py", "generate",
+            run_main([
+                "generate",
                 "--asin-sku", ASIN_FILE,
                 "--amazon-export", export_file,
                 "--output", OUTPUT_FILE
@@ -73,8 +83,8 @@ def main():
         else:
             print(f"No export file found ({TRIMMED_FILE} or {BULK_FILE})")
             print("Generating empty template instead...")
-            run_command([
-                "python3", "main.py", "generate",
+            run_main([
+                "generate",
                 "--asin-sku", ASIN_FILE,
                 "--output", OUTPUT_FILE
             ])
@@ -83,15 +93,15 @@ def main():
         # Trim then generate
         if Path(BULK_FILE).exists():
             print("=== Step 1: Trimming bulk file ===")
-            if run_command([
-                "python3", "main.py", "trim",
+            if run_main([
+                "trim",
                 "--bulk-file", BULK_FILE,
                 "--asin-sku", ASIN_FILE,
                 "--output", TRIMMED_FILE
             ]):
                 print("\n=== Step 2: Generating goals ===")
-                run_command([
-                    "python3", "main.py", "generate",
+                run_main([
+                    "generate",
                     "--asin-sku", ASIN_FILE,
                     "--amazon-export", TRIMMED_FILE,
                     "--output", OUTPUT_FILE
@@ -102,8 +112,8 @@ def main():
 
     elif command == "template":
         # Generate empty template
-        run_command([
-            "python3", "main.py", "generate",
+        run_main([
+            "generate",
             "--asin-sku", ASIN_FILE,
             "--output", OUTPUT_FILE
         ])